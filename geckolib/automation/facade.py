@@ -72,6 +72,9 @@ class GeckoFacade(Observable):
     def wait(self, timeout):
         self.spa.wait(timeout)
 
+    def wait_for_connection(self, timeout):
+        return self.spa.wait_for_connection(timeout)
+
     def scan_outputs(self):
         """ Scan the spa outputs to decide what user options are available """
         # Get list of outputs from the configuration
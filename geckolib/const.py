@@ -84,6 +84,7 @@ class GeckoConstants:
     EXCEPTION_MESSAGE_NOT_WRITABLE = (
         "Cannot set value for {0}. This status array item doesn't allow writing"
     )
+    EXCEPTION_MESSAGE_NOT_ENUM_MEMBER = "{0!r} is not a member of {1} {2}"
 
     # Water heater status
     WATER_HEATER_HEATING = "Heating"
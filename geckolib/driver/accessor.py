@@ -1,10 +1,10 @@
 """ Structure accessor """
 
-import struct
 import logging
 
 from ..const import GeckoConstants
 from .observable import Observable
+from .protocol.packet import U8_STRUCT, U16_STRUCT
 
 logger = logging.getLogger(__name__)
 
@@ -15,54 +15,54 @@ class GeckoStructAccessor(Observable):
 
     def __init__(self, struct_, element):
         super().__init__()
-        self.element = element
+        # Everything needed from the declaration is parsed here, so the element
+        # itself isn't retained and reads/writes don't touch the XML
+        attrib = element.attrib
         self.tag = element.tag
         self.struct = struct_
-        self.pos = int(element.attrib[GeckoConstants.SPA_PACK_STRUCT_POS_ATTRIB])
-        self.type = element.attrib[GeckoConstants.SPA_PACK_STRUCT_TYPE_ATTRIB]
+        self.pos = int(attrib[GeckoConstants.SPA_PACK_STRUCT_POS_ATTRIB])
+        self.type = attrib[GeckoConstants.SPA_PACK_STRUCT_TYPE_ATTRIB]
         self.bitpos = None
 
-        if GeckoConstants.SPA_PACK_STRUCT_BITPOS_ATTRIB in element.attrib:
-            self.bitpos = int(
-                element.attrib[GeckoConstants.SPA_PACK_STRUCT_BITPOS_ATTRIB]
-            )
+        if GeckoConstants.SPA_PACK_STRUCT_BITPOS_ATTRIB in attrib:
+            self.bitpos = int(attrib[GeckoConstants.SPA_PACK_STRUCT_BITPOS_ATTRIB])
             self.bitmask = 1
-        if GeckoConstants.SPA_PACK_STRUCT_ITEMS_ATTRIB in element.attrib:
-            self.items = element.attrib[
-                GeckoConstants.SPA_PACK_STRUCT_ITEMS_ATTRIB
-            ].split("|")
+        if GeckoConstants.SPA_PACK_STRUCT_ITEMS_ATTRIB in attrib:
+            self.items = tuple(
+                attrib[GeckoConstants.SPA_PACK_STRUCT_ITEMS_ATTRIB].split("|")
+            )
+            # Keep the first index of any duplicated name, as list.index() would
+            self._items_by_name = {}
+            for index, item in enumerate(self.items):
+                self._items_by_name.setdefault(item, index)
 
         self.length = 1
-        self.format = ">B"
+        self._codec = U8_STRUCT
 
-        if GeckoConstants.SPA_PACK_STRUCT_SIZE_ATTRIB in element.attrib:
-            self.length = int(
-                element.attrib[GeckoConstants.SPA_PACK_STRUCT_SIZE_ATTRIB]
-            )
+        if GeckoConstants.SPA_PACK_STRUCT_SIZE_ATTRIB in attrib:
+            self.length = int(attrib[GeckoConstants.SPA_PACK_STRUCT_SIZE_ATTRIB])
             if self.length == 2:
-                self.format = ">H"
+                self._codec = U16_STRUCT
 
         if (
             self.type == GeckoConstants.SPA_PACK_STRUCT_WORD_TYPE
             or self.type == GeckoConstants.SPA_PACK_STRUCT_TIME_TYPE
         ):
             self.length = 2
-            self.format = ">H"
-        if GeckoConstants.SPA_PACK_STRUCT_MAXITEMS_ATTRIB in element.attrib:
-            self.maxitems = int(
-                element.attrib[GeckoConstants.SPA_PACK_STRUCT_MAXITEMS_ATTRIB]
-            )
+            self._codec = U16_STRUCT
+        if GeckoConstants.SPA_PACK_STRUCT_MAXITEMS_ATTRIB in attrib:
+            self.maxitems = int(attrib[GeckoConstants.SPA_PACK_STRUCT_MAXITEMS_ATTRIB])
             if self.maxitems > 8:
                 self.bitmask = 15
             elif self.maxitems > 4:
                 self.bitmask = 7
             elif self.maxitems > 2:
                 self.bitmask = 3
-        self.read_write = None
-        if GeckoConstants.SPA_PACK_STRUCT_READ_WRITE_ATTRIB in element.attrib:
-            self.read_write = element.attrib[
-                GeckoConstants.SPA_PACK_STRUCT_READ_WRITE_ATTRIB
-            ]
+        self.read_write = attrib.get(GeckoConstants.SPA_PACK_STRUCT_READ_WRITE_ATTRIB)
+
+        # Bit fields are masked in place, so precompute the shifted mask
+        if self.bitpos is not None:
+            self._mask = self.bitmask << self.bitpos
 
     def status_block_changed(self, offset, len, previous):
         # Does the notified range intersect us, if not then we don't care!
@@ -98,14 +98,12 @@ class GeckoStructAccessor(Observable):
         or using the optionally supplied status_block (used by change notification)"""
         if status_block is None:
             status_block = self.struct.status_block
-        data = struct.unpack(
-            self.format, status_block[self.pos : self.pos + self.length]
-        )[0]
+        data = self._codec.unpack_from(status_block, self.pos)[0]
         logger.debug(
             "Accessor %s @ %s, %s raw data = %x", self.tag, self.pos, self.type, data
         )
         if self.bitpos is not None:
-            data = (data >> self.bitpos) & self.bitmask
+            data = (data & self._mask) >> self.bitpos
             logger.debug(
                 "BitPos %s accessor %s adjusted data = %x",
                 (self.bitpos, self.bitmask),
@@ -120,11 +118,11 @@ class GeckoStructAccessor(Observable):
             data = data == 1
             logger.debug("Bool accessor %s adjusted data = %s", self.tag, data)
         elif self.type == GeckoConstants.SPA_PACK_STRUCT_ENUM_TYPE:
-            try:
+            if data < len(self.items):
                 data = self.items[data]
                 logger.debug("Enum accessor %s adjusted data = %s", self.tag, data)
-            except IndexError:
-                logger.exception(
+            else:
+                logger.error(
                     "Enum accessor %s out-of-range for %s", self.tag, self.items
                 )
         return data
@@ -138,12 +136,17 @@ class GeckoStructAccessor(Observable):
 
         if self.type == GeckoConstants.SPA_PACK_STRUCT_ENUM_TYPE:
             logger.debug("Enum accessor %s adjusted from %s", self.tag, newvalue)
-            newvalue = self.items.index(newvalue)
+            index = self._items_by_name.get(newvalue)
+            if index is None:
+                raise ValueError(
+                    GeckoConstants.EXCEPTION_MESSAGE_NOT_ENUM_MEMBER.format(
+                        newvalue, self.tag, self.items
+                    )
+                )
+            newvalue = index
 
         # If it is a bitpos, then mask it with the existing value
-        existing = struct.unpack(
-            self.format, self.struct.status_block[self.pos : self.pos + self.length]
-        )[0]
+        existing = self._codec.unpack_from(self.struct.status_block, self.pos)[0]
         if self.bitpos is not None:
             logger.debug(
                 "Bitpos %s accessor %s adjusted from %s",
@@ -151,8 +154,8 @@ class GeckoStructAccessor(Observable):
                 self.tag,
                 newvalue,
             )
-            newvalue = (existing & ~(self.bitmask << self.bitpos)) | (
-                (newvalue & self.bitmask) << self.bitpos
+            newvalue = (existing & ~self._mask) | (
+                (newvalue << self.bitpos) & self._mask
             )
 
         logger.debug(
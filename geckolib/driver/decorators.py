@@ -8,9 +8,6 @@ class GeckoTemperatureDecorator(GeckoStructAccessor):
     """Class to decorate a temperature accessor so that the farenheight tenths, offset
     from freezing are handled"""
 
-    def __init__(self, struct_, accessor):
-        super().__init__(struct_, accessor.element)
-
     def _get_value(self, status_block=None):
         """ Get the temperature """
         # Internally, temp is in farenheight tenths, offset from freezing point
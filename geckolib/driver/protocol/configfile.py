@@ -1,10 +1,9 @@
 """ Gecko FILES/SFILE handlers """
 
 import logging
-import struct
 
 from ...const import GeckoConstants
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 SFILE_VERB = b"SFILE"
 FILES_VERB = b"FILES"
@@ -16,7 +15,7 @@ class GeckoConfigFileProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def request(seq, **kwargs):
         return GeckoConfigFileProtocolHandler(
-            content=b"".join([SFILE_VERB, struct.pack(">B", seq)]),
+            content=VERB_U8_STRUCT.pack(SFILE_VERB, seq),
             timeout=2,
             retry_count=10,
             on_retry_failed=GeckoPacketProtocolHandler._default_retry_failed_handler,
@@ -48,9 +47,8 @@ class GeckoConfigFileProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
         if received_bytes.startswith(SFILE_VERB):
-            self._sequence = struct.unpack(">B", remainder)[0]
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return  # Stay in the handler list
 
         # Otherwise must be FILES
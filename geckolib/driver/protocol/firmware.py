@@ -1,13 +1,14 @@
 """ Gecko UPDTS/SUPDT handlers """
 
 import logging
-import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 UPDTS_VERB = b"UPDTS"
 SUPDT_VERB = b"SUPDT"
 
+_RESPONSE_CONTENT = SUPDT_VERB + b"\x00"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -15,19 +16,13 @@ class GeckoUpdateFirmwareProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def request(seq, **kwargs):
         return GeckoUpdateFirmwareProtocolHandler(
-            content=b"".join([UPDTS_VERB, struct.pack(">B", seq)]), **kwargs
+            content=VERB_U8_STRUCT.pack(UPDTS_VERB, seq), **kwargs
         )
 
     @staticmethod
     def response(**kwargs):
         return GeckoUpdateFirmwareProtocolHandler(
-            content=b"".join(
-                [
-                    SUPDT_VERB,
-                    b"\x00",
-                ]
-            ),
-            **kwargs,
+            content=_RESPONSE_CONTENT, **kwargs
         )
 
     def __init__(self, **kwargs):
@@ -39,9 +34,8 @@ class GeckoUpdateFirmwareProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
         if received_bytes.startswith(UPDTS_VERB):
-            self._sequence = struct.unpack(">B", remainder[0:1])[0]
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return  # Stay in the handler list
         # Otherwise must be SUPDT
         self._should_remove_handler = True
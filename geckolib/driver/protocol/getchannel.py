@@ -3,11 +3,12 @@
 import logging
 import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 CURCH_VERB = b"CURCH"
 CHCUR_VERB = b"CHCUR"
-GETCHANNEL_FORMAT = ">BB"
+
+_RESPONSE_STRUCT = struct.Struct(">5sBB")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,7 +17,7 @@ class GeckoGetChannelProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def request(seq, **kwargs):
         return GeckoGetChannelProtocolHandler(
-            content=b"".join([CURCH_VERB, struct.pack(">B", seq)]),
+            content=VERB_U8_STRUCT.pack(CURCH_VERB, seq),
             timeout=2,
             retry_count=10,
             on_retry_failed=GeckoPacketProtocolHandler._default_retry_failed_handler,
@@ -26,16 +27,7 @@ class GeckoGetChannelProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def response(channel, signal_strength, **kwargs):
         return GeckoGetChannelProtocolHandler(
-            content=b"".join(
-                [
-                    CHCUR_VERB,
-                    struct.pack(
-                        GETCHANNEL_FORMAT,
-                        channel,
-                        signal_strength,
-                    ),
-                ]
-            ),
+            content=_RESPONSE_STRUCT.pack(CHCUR_VERB, channel, signal_strength),
             **kwargs,
         )
 
@@ -49,13 +41,13 @@ class GeckoGetChannelProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
         if received_bytes.startswith(CURCH_VERB):
-            self._sequence = struct.unpack(">B", remainder)[0]
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return  # Stay in the handler list
         # Otherwise must be CHCUR
         (
+            _,
             self.channel,
             self.signal_strength,
-        ) = struct.unpack(GETCHANNEL_FORMAT, remainder)
+        ) = _RESPONSE_STRUCT.unpack_from(received_bytes)
         self._should_remove_handler = True
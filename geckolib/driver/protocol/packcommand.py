@@ -3,13 +3,21 @@
 import logging
 import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, U8_STRUCT
 
 SPACK_VERB = b"SPACK"
 PACKS_VERB = b"PACKS"
 PACK_COMMAND_KEY_PRESS = 57
 PACK_COMMAND_SET_VALUE = 70
 
+_SET_VALUE_STRUCTS = {
+    1: struct.Struct(">5sBBBBBBHB"),
+    2: struct.Struct(">5sBBBBBBHH"),
+}
+_KEYPRESS_STRUCT = struct.Struct(">5sBBBBB")
+_COMMAND_HEADER_STRUCT = struct.Struct(">BBBB")
+_SET_VALUE_HEADER_STRUCT = struct.Struct(">BBH")
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -18,29 +26,20 @@ class GeckoPackCommandProtocolHandler(GeckoPacketProtocolHandler):
     def set_value(
         seq, pack_type, config_version, log_version, pos, len, data, **kwargs
     ):
-        if len == 1:
-            data = struct.pack(">B", data)
-        elif len == 2:
-            data = struct.pack(">H", data)
-        else:
+        if len not in _SET_VALUE_STRUCTS:
             raise OverflowError(len)
 
         return GeckoPackCommandProtocolHandler(
-            content=b"".join(
-                [
-                    SPACK_VERB,
-                    struct.pack(
-                        ">BBBBBBH",
-                        seq,
-                        pack_type,
-                        5 + len,
-                        PACK_COMMAND_SET_VALUE,
-                        config_version,
-                        log_version,
-                        pos,
-                    ),
-                    data,
-                ]
+            content=_SET_VALUE_STRUCTS[len].pack(
+                SPACK_VERB,
+                seq,
+                pack_type,
+                5 + len,
+                PACK_COMMAND_SET_VALUE,
+                config_version,
+                log_version,
+                pos,
+                data,
             ),
             **kwargs,
         )
@@ -48,13 +47,8 @@ class GeckoPackCommandProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def keypress(seq, pack_type, key, **kwargs):
         return GeckoPackCommandProtocolHandler(
-            content=b"".join(
-                [
-                    SPACK_VERB,
-                    struct.pack(
-                        ">BBBBB", seq, pack_type, 2, PACK_COMMAND_KEY_PRESS, key
-                    ),
-                ]
+            content=_KEYPRESS_STRUCT.pack(
+                SPACK_VERB, seq, pack_type, 2, PACK_COMMAND_KEY_PRESS, key
             ),
             **kwargs,
         )
@@ -78,27 +72,30 @@ class GeckoPackCommandProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
         if received_bytes.startswith(PACKS_VERB):
-            self._should_remove_handler = True
-            return
+            return  # Stay in the handler list
         # Otherwise must be SPACK, so work out what is going on ...
-        self._sequence, self.pack_type, length, command = struct.unpack(
-            ">BBBB", remainder[0:4]
-        )
+        (
+            self._sequence,
+            self.pack_type,
+            length,
+            command,
+        ) = _COMMAND_HEADER_STRUCT.unpack_from(received_bytes, 5)
         if command == PACK_COMMAND_KEY_PRESS:
             if length == 2:
                 self.is_key_press = True
                 self.is_set_value = False
-                self.keycode = struct.unpack(">B", remainder[4:])[0]
+                self.keycode = U8_STRUCT.unpack_from(received_bytes, 9)[0]
             else:
                 _LOGGER.warning("SPACK key press command incorrect length")
         elif command == PACK_COMMAND_SET_VALUE:
             self.is_set_value = True
             self.is_key_press = False
-            config_version, log_version, self.position = struct.unpack(
-                ">BBH", remainder[4:8]
-            )
-            self.new_data = remainder[8:]
+            (
+                config_version,
+                log_version,
+                self.position,
+            ) = _SET_VALUE_HEADER_STRUCT.unpack_from(received_bytes, 9)
+            self.new_data = received_bytes[13:]
         else:
             _LOGGER.warning("Unhandled SPACK command %d", command)
@@ -2,6 +2,7 @@
 
 import logging
 import re
+import struct
 
 from ..udp_socket import GeckoUdpProtocolHandler
 
@@ -14,6 +15,16 @@ DESCN_CLOSE = b"</DESCN>"
 DATAS_OPEN = b"<DATAS>"
 DATAS_CLOSE = b"</DATAS>"
 
+# Codecs shared by the packet handlers. Fixed layout messages define a single
+# verb prefixed Struct which is used both to pack and to unpack them, and these
+# cover the common verb+byte layout and fields read from variable layouts
+U8_STRUCT = struct.Struct(">B")
+U16_STRUCT = struct.Struct(">H")
+VERB_U8_STRUCT = struct.Struct(">5sB")
+
+# Marks send_bytes as not yet built, distinct from any real parms value
+_NOT_BUILT = object()
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -27,24 +38,31 @@ class GeckoPacketProtocolHandler(GeckoUdpProtocolHandler):
                 raise TypeError(self._content, "Content must be of type `bytes`")
         self._packet_content = None
         self._sequence = None
+        self._send_parms = _NOT_BUILT
+        self._packet_bytes = None
 
     @property
     def send_bytes(self):
-        return b"".join(
-            [
-                PACKET_OPEN,
-                SRCCN_OPEN,
-                self._parms[3],
-                SRCCN_CLOSE,
-                DESCN_OPEN,
-                self._parms[2],
-                DESCN_CLOSE,
-                DATAS_OPEN,
-                self._content,
-                DATAS_CLOSE,
-                PACKET_CLOSE,
-            ]
-        )
+        # Handlers such as ping get sent repeatedly, so keep the assembled packet
+        # until the parms it was built from change
+        if self._send_parms is not self._parms:
+            self._send_parms = self._parms
+            self._packet_bytes = b"".join(
+                [
+                    PACKET_OPEN,
+                    SRCCN_OPEN,
+                    self._parms[3],
+                    SRCCN_CLOSE,
+                    DESCN_OPEN,
+                    self._parms[2],
+                    DESCN_CLOSE,
+                    DATAS_OPEN,
+                    self._content,
+                    DATAS_CLOSE,
+                    PACKET_CLOSE,
+                ]
+            )
+        return self._packet_bytes
 
     @property
     def parms(self):
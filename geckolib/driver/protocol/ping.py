@@ -1,11 +1,11 @@
 """ Gecko APING handlers """
 
 import logging
-import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 PING_VERB = b"APING"
+_RESPONSE_CONTENT = PING_VERB + b"\x00"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,14 +17,11 @@ class GeckoPingProtocolHandler(GeckoPacketProtocolHandler):
 
     @staticmethod
     def response(**kwargs):
-        return GeckoPingProtocolHandler(
-            content=b"".join([PING_VERB, b"\x00"]), **kwargs
-        )
+        return GeckoPingProtocolHandler(content=_RESPONSE_CONTENT, **kwargs)
 
     def can_handle(self, received_bytes: bytes, sender: tuple) -> bool:
         return received_bytes.startswith(PING_VERB)
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
-        if len(remainder) > 0:
-            self._sequence = struct.unpack(">B", remainder)[0]
+        if len(received_bytes) > 5:
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
@@ -1,13 +1,18 @@
 """ Gecko REQRM/RMREQ handlers """
 
 import logging
-import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 REQRM_VERB = b"REQRM"
 RMREQ_VERB = b"RMREQ"
 
+_RESPONSE_CONTENT = (
+    RMREQ_VERB + b"\x01\x01\x00\x01\x02\x1f\x00\x01\x03\x29"
+    b"\x00\x01\x04\xa9\x02\x01\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -15,22 +20,12 @@ class GeckoRemindersProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def request(seq, **kwargs):
         return GeckoRemindersProtocolHandler(
-            content=b"".join([REQRM_VERB, struct.pack(">B", seq)]), **kwargs
+            content=VERB_U8_STRUCT.pack(REQRM_VERB, seq), **kwargs
         )
 
     @staticmethod
     def response(**kwargs):
-        return GeckoRemindersProtocolHandler(
-            content=b"".join(
-                [
-                    RMREQ_VERB,
-                    b"\x01\x01\x00\x01\x02\x1f\x00\x01\x03\x29"
-                    b"\x00\x01\x04\xa9\x02\x01\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00"
-                    b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
-                ]
-            ),
-            **kwargs,
-        )
+        return GeckoRemindersProtocolHandler(content=_RESPONSE_CONTENT, **kwargs)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -41,9 +36,8 @@ class GeckoRemindersProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
         if received_bytes.startswith(REQRM_VERB):
-            self._sequence = struct.unpack(">B", remainder[0:1])[0]
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return  # Stay in the handler list
         # Otherwise must be RMREQ
         self._should_remove_handler = True
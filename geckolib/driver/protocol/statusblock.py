@@ -3,15 +3,20 @@
 import logging
 import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import (
+    GeckoPacketProtocolHandler,
+    U8_STRUCT,
+    U16_STRUCT,
+    VERB_U8_STRUCT,
+)
 
 STATU_VERB = b"STATU"
 STATV_VERB = b"STATV"
 STATQ_VERB = b"STATQ"
 STATP_VERB = b"STATP"
 
-REQUEST_FORMAT = ">BHH"
-RESPONSE_FORMAT = ">BBB"
+_REQUEST_STRUCT = struct.Struct(">5sBHH")
+_RESPONSE_HEADER_STRUCT = struct.Struct(">5sBBB")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,9 +26,7 @@ class GeckoStatusBlockProtocolHandler(GeckoPacketProtocolHandler):
     def request(seq, start, length, **kwargs):
         return GeckoStatusBlockProtocolHandler(
             start=start,
-            content=b"".join(
-                [STATU_VERB, struct.pack(REQUEST_FORMAT, seq, start, length)]
-            ),
+            content=_REQUEST_STRUCT.pack(STATU_VERB, seq, start, length),
             retry_count=5,
             **kwargs,
         )
@@ -38,8 +41,7 @@ class GeckoStatusBlockProtocolHandler(GeckoPacketProtocolHandler):
             start=0,
             content=b"".join(
                 [
-                    STATV_VERB,
-                    struct.pack(RESPONSE_FORMAT, index, next, len(block)),
+                    _RESPONSE_HEADER_STRUCT.pack(STATV_VERB, index, next, len(block)),
                     block,
                 ]
             ),
@@ -57,17 +59,22 @@ class GeckoStatusBlockProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
         if received_bytes.startswith(STATU_VERB):
-            self.sequence, self.start, self.length = struct.unpack(
-                REQUEST_FORMAT, remainder
-            )
+            (
+                _,
+                self.sequence,
+                self.start,
+                self.length,
+            ) = _REQUEST_STRUCT.unpack_from(received_bytes)
             return  # Stay in the handler list
         # Otherwise must be STATV
-        self.sequence, self.next, self.length = struct.unpack(
-            RESPONSE_FORMAT, remainder[0:3]
-        )
-        self.data = remainder[3 : self.length + 3]
+        (
+            _,
+            self.sequence,
+            self.next,
+            self.length,
+        ) = _RESPONSE_HEADER_STRUCT.unpack_from(received_bytes)
+        self.data = received_bytes[8 : self.length + 8]
         _LOGGER.debug(
             "Status block segment # %d (then #%d) length %d, %r",
             self.sequence,
@@ -96,28 +103,23 @@ class GeckoPartialStatusBlockProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple) -> bool:
-        remainder = received_bytes[5:]
         if received_bytes.startswith(STATQ_VERB):
-            (self.sequence,) = struct.unpack(">B", remainder)
+            self.sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return  # Stay in the handler list
 
         # Otherwise must be STATP
         if socket is not None:
             socket.queue_send(
                 GeckoPartialStatusBlockProtocolHandler(
-                    content=b"".join(
-                        [
-                            STATQ_VERB,
-                            struct.pack(
-                                ">B", socket.get_and_increment_sequence_counter()
-                            ),
-                        ]
+                    content=VERB_U8_STRUCT.pack(
+                        STATQ_VERB, socket.get_and_increment_sequence_counter()
                     ),
                     parms=sender,
                 ),
                 sender,
             )
-        change_count = struct.unpack(">B", remainder[0:1])[0]
+        change_count = U8_STRUCT.unpack_from(received_bytes, 5)[0]
         for i in range(change_count):
-            pos = struct.unpack(">H", remainder[1 + (i * 4) : 3 + (i * 4)])[0]
-            self.changes.append((pos, remainder[3 + (i * 4) : 5 + (i * 4)]))
+            offset = 6 + (i * 4)
+            pos = U16_STRUCT.unpack_from(received_bytes, offset)[0]
+            self.changes.append((pos, received_bytes[offset + 2 : offset + 4]))
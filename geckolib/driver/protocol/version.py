@@ -3,11 +3,15 @@
 import logging
 import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 AVERS_VERB = b"AVERS"
 SVERS_VERB = b"SVERS"
-VERSION_FORMAT = ">HBBHBB"
+_VERBS = frozenset((AVERS_VERB, SVERS_VERB))
+
+# The verb is folded into the format as a fixed length prefix so that a
+# single pack produces the complete packet content
+_RESPONSE_STRUCT = struct.Struct(">5sHBBHBB")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,7 +20,7 @@ class GeckoVersionProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def request(seq, **kwargs):
         return GeckoVersionProtocolHandler(
-            content=b"".join([AVERS_VERB, struct.pack(">B", seq)]),
+            content=VERB_U8_STRUCT.pack(AVERS_VERB, seq),
             timeout=2,
             retry_count=10,
             on_retry_failed=GeckoPacketProtocolHandler._default_retry_failed_handler,
@@ -26,16 +30,7 @@ class GeckoVersionProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def response(intouch_EN: tuple, intouch_CO: tuple, **kwargs):
         return GeckoVersionProtocolHandler(
-            content=b"".join(
-                [
-                    SVERS_VERB,
-                    struct.pack(
-                        VERSION_FORMAT,
-                        *intouch_EN,
-                        *intouch_CO,
-                    ),
-                ]
-            ),
+            content=_RESPONSE_STRUCT.pack(SVERS_VERB, *intouch_EN, *intouch_CO),
             **kwargs,
         )
 
@@ -45,22 +40,21 @@ class GeckoVersionProtocolHandler(GeckoPacketProtocolHandler):
         self.co_build = self.co_major = self.co_minor = None
 
     def can_handle(self, received_bytes: bytes, sender: tuple) -> bool:
-        return received_bytes.startswith(AVERS_VERB) or received_bytes.startswith(
-            SVERS_VERB
-        )
+        # Both verbs are 5 bytes, so one slice and a set lookup will do
+        return received_bytes[:5] in _VERBS
 
     def handle(self, socket, received_bytes: bytes, sender: tuple):
-        remainder = received_bytes[5:]
-        if received_bytes.startswith(AVERS_VERB):
-            self._sequence = struct.unpack(">B", remainder)[0]
+        if received_bytes[:5] == AVERS_VERB:
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return
         # Otherwise must be SVERS
         (
+            _,
             self.en_build,
             self.en_major,
             self.en_minor,
             self.co_build,
             self.co_major,
             self.co_minor,
-        ) = struct.unpack(VERSION_FORMAT, remainder)
+        ) = _RESPONSE_STRUCT.unpack_from(received_bytes)
         self._should_remove_handler = True
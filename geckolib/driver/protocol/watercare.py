@@ -3,7 +3,7 @@
 import logging
 import struct
 
-from .packet import GeckoPacketProtocolHandler
+from .packet import GeckoPacketProtocolHandler, VERB_U8_STRUCT
 
 GETWC_VERB = b"GETWC"
 WCGET_VERB = b"WCGET"
@@ -12,9 +12,12 @@ WCSET_VERB = b"WCSET"
 REQWC_VERB = b"REQWC"
 WCREQ_VERB = b"WCREQ"
 
-
-GET_WATERCARE_FORMAT = ">B"
-SET_WATERCARE_FORMAT = ">BB"
+_SET_STRUCT = struct.Struct(">5sBB")
+_SCHEDULE_CONTENT = (
+    WCREQ_VERB + b"\x00\x00\x00\x01\x00\x00\x06\x00\x00\x00\x00\x02\x01\x00\x01\x05"
+    b"\x06\x00\x12\x00\x03\x01\x00\x00\x06\x06\x00\x12\x00\x04\x01\x00"
+    b"\x01\x05\x00\x00\x00\x00"
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +26,7 @@ class GeckoWatercareProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def request(seq, **kwargs):
         return GeckoWatercareProtocolHandler(
-            content=b"".join([GETWC_VERB, struct.pack(">B", seq)]),
+            content=VERB_U8_STRUCT.pack(GETWC_VERB, seq),
             timeout=2,
             retry_count=10,
             on_retry_failed=GeckoPacketProtocolHandler._default_retry_failed_handler,
@@ -33,9 +36,7 @@ class GeckoWatercareProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def set(seq, mode, **kwargs):
         return GeckoWatercareProtocolHandler(
-            content=b"".join(
-                [SETWC_VERB, struct.pack(SET_WATERCARE_FORMAT, seq, mode)]
-            ),
+            content=_SET_STRUCT.pack(SETWC_VERB, seq, mode),
             timeout=4,
             **kwargs,
         )
@@ -43,29 +44,14 @@ class GeckoWatercareProtocolHandler(GeckoPacketProtocolHandler):
     @staticmethod
     def response(mode, **kwargs):
         return GeckoWatercareProtocolHandler(
-            content=b"".join(
-                [
-                    WCGET_VERB,
-                    struct.pack(
-                        GET_WATERCARE_FORMAT,
-                        mode,
-                    ),
-                ]
-            ),
+            content=VERB_U8_STRUCT.pack(WCGET_VERB, mode),
             **kwargs,
         )
 
     @staticmethod
     def schedule(**kwargs):
         return GeckoWatercareProtocolHandler(
-            content=b"".join(
-                [
-                    WCREQ_VERB,
-                    b"\x00\x00\x00\x01\x00\x00\x06\x00\x00\x00\x00\x02\x01\x00\x01\x05"
-                    b"\x06\x00\x12\x00\x03\x01\x00\x00\x06\x06\x00\x12\x00\x04\x01\x00"
-                    b"\x01\x05\x00\x00\x00\x00",
-                ]
-            ),
+            content=_SCHEDULE_CONTENT,
             **kwargs,
         )
 
@@ -82,14 +68,13 @@ class GeckoWatercareProtocolHandler(GeckoPacketProtocolHandler):
         )
 
     def handle(self, socket, received_bytes: bytes, sender: tuple) -> bool:
-        remainder = received_bytes[5:]
         if received_bytes.startswith(GETWC_VERB):
-            self._sequence = struct.unpack(">B", remainder)[0]
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             return  # Stay in the handler list
         if received_bytes.startswith(REQWC_VERB):
-            self._sequence = struct.unpack(">B", remainder)[0]
+            self._sequence = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
             self.schedule = True
             return  # Stay in the handler list
         # Otherwise must be WCGET
-        self.mode = struct.unpack(GET_WATERCARE_FORMAT, remainder)[0]
+        self.mode = VERB_U8_STRUCT.unpack_from(received_bytes)[1]
         self._should_remove_handler = True
@@ -1,5 +1,6 @@
 """ Spa Structure block """
 
+from bisect import bisect_left
 import logging
 
 from ..const import GeckoConstants
@@ -11,12 +12,22 @@ from .decorators import GeckoTemperatureDecorator
 logger = logging.getLogger(__name__)
 
 
+def _is_temperature(tag):
+    tag = tag.lower()
+    return "temp" in tag or "setpoint" in tag
+
+
 class GeckoStructure:
     """Class to host/manage the raw data block for a spa structure"""
 
     def __init__(self, on_set_value):
-        self._status_block = b"\x00" * 1024
+        # The status block is updated in place. No long lived views are kept on
+        # it so that it can still grow if a segment extends past the end
+        self._status_block = bytearray(1024)
         self.accessors = {}
+        self._accessors_by_pos = []
+        self._accessor_positions = []
+        self._max_accessor_length = 0
         self.had_at_least_one_block = False
         self._on_set_value = on_set_value
 
@@ -24,23 +35,53 @@ class GeckoStructure:
 
     def replace_status_block_segment(self, offset, segment):
         """ Replace a segment of the status block """
-        previous_block = self._status_block
-        segment_len = len(segment)
-        self._status_block = (
-            self._status_block[0:offset]
-            + segment
-            + self._status_block[offset + segment_len :]
-        )
+        self.replace_status_block_segments([(offset, segment)])
+
+    def replace_status_block_segments(self, changes):
+        """Replace a number of (offset, segment) pairs in the status block, then
+        notify each affected accessor once all the changes have been applied"""
+        # Change notification needs the previous block, but there is no need to
+        # take a copy if nobody is listening
+        previous_block = bytes(self._status_block) if self.accessors else None
+        ranges = []
+        for offset, segment in changes:
+            end = offset + len(segment)
+            self._status_block[offset:end] = segment
+            ranges.append((offset, end))
+        if previous_block is None:
+            return
+
+        # Merge overlapping and adjacent ranges so each accessor is found once
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
         # Notify changes to accessors
-        for accessor in self.accessors.values():
-            accessor.status_block_changed(offset, segment_len, previous_block)
+        notified = set()
+        for start, end in merged:
+            for accessor in self._accessors_in_range(start, end):
+                if accessor.tag in notified:
+                    continue
+                notified.add(accessor.tag)
+                accessor.status_block_changed(start, end - start, previous_block)
+
+    def _accessors_in_range(self, start, end):
+        """Get the accessors that might intersect the range start-end"""
+        low = bisect_left(
+            self._accessor_positions, start - self._max_accessor_length + 1
+        )
+        high = bisect_left(self._accessor_positions, end)
+        return self._accessors_by_pos[low:high]
 
     @property
     def status_block(self):
         return self._status_block
 
     def set_status_block(self, block):
-        self._status_block = block
+        self._status_block[:] = block
 
     def _on_status_block_received(
         self, handler: GeckoStatusBlockProtocolHandler, socket, sender
@@ -68,26 +109,40 @@ class GeckoStructure:
                 self.had_at_least_one_block = True
                 handler._should_remove_handler = True
 
+    def _iter_accessors(self, xmllist):
+        """Yield (tag, accessor) for each positioned element in the declarations,
+        decorating the temperature ones as we go"""
+        for xml in xmllist:
+            for element in xml.iter():
+                if element is xml:
+                    continue
+                if GeckoConstants.SPA_PACK_STRUCT_POS_ATTRIB not in element.attrib:
+                    continue
+                is_word = (
+                    element.get(GeckoConstants.SPA_PACK_STRUCT_TYPE_ATTRIB)
+                    == GeckoConstants.SPA_PACK_STRUCT_WORD_TYPE
+                )
+                if is_word and _is_temperature(element.tag):
+                    logger.debug("Decorating temperature key %s", element.tag)
+                    yield element.tag, GeckoTemperatureDecorator(self, element)
+                else:
+                    yield element.tag, GeckoStructAccessor(self, element)
+
     def build_accessors(self, xmllist):
-        self.accessors = {
-            element.tag: GeckoStructAccessor(self, element)
-            for xml in xmllist
-            for element in xml.findall(
-                GeckoConstants.SPA_PACK_STRUCT_POS_ELEMENTS_XPATH
-            )
-        }
-        # Fix temperature accessors ...
-        temp_keys = {
-            element.tag
-            for xml in xmllist
-            for element in xml.findall(
-                GeckoConstants.SPA_PACK_STRUCT_WORD_TYPE_ELEMENTS_XPATH
-            )
-            if "temp" in element.tag.lower() or "setpoint" in element.tag.lower()
-        }
-        logger.debug("Temperature keys to decorate %s", temp_keys)
-        for key in temp_keys:
-            self.accessors[key] = GeckoTemperatureDecorator(self, self.accessors[key])
+        # A single pass over each declaration builds the accessors and decorates
+        # the temperature ones, rather than walking the XML once per XPath
+        self.accessors = dict(self._iter_accessors(xmllist))
+
+        # Keep a position ordered index so changes can find accessors quickly
+        self._accessors_by_pos = sorted(
+            self.accessors.values(), key=lambda accessor: accessor.pos
+        )
+        self._accessor_positions = [
+            accessor.pos for accessor in self._accessors_by_pos
+        ]
+        self._max_accessor_length = max(
+            (accessor.length for accessor in self._accessors_by_pos), default=0
+        )
 
     def retry_request(
         self,
@@ -46,7 +46,7 @@ class GeckoSpaDescriptor:
         facade = GeckoFacade(GeckoSpa(self).start_connect())
         if wait_for_connection:
             while not facade.is_connected:
-                facade.wait(0.1)
+                facade.wait_for_connection(0.25)
         return facade
 
     @property
@@ -73,6 +73,14 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
         GeckoSpaPack.__init__(self)
 
         self.descriptor = descriptor
+        # The descriptor doesn't change once we have it, so build these once
+        self._destination = descriptor.destination
+        self._sendparms = (
+            self._destination[0],
+            self._destination[1],
+            descriptor.identifier,
+            descriptor.client_identifier,
+        )
         self.on_connected = None
 
         self.add_receive_handler(GeckoPacketProtocolHandler())
@@ -81,8 +89,10 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
                 on_handled=self._on_partial_status_update
             )
         )
+        # One handler deals with the acknowledgements for all pack commands
+        self.add_receive_handler(GeckoPackCommandProtocolHandler())
         self._last_ping = time.monotonic()
-        self._ping_thread = threading.Thread(target=self._ping_thread_func, daemon=True)
+        self._next_ping = None
 
         # Default values for properties
         self.channel = 0
@@ -92,12 +102,15 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
         self.intouch_version_co = ""
 
         self.gecko_pack_xml = None
+        self._plateforms_by_name = None
         self.config_version = 0
         self.config_xml = None
         self.log_version = 0
         self.log_xml = None
+        self._log_begin = self._log_end = None
         self.pack_type = None
         self._is_connected = False
+        self._connected_event = threading.Event()
         self._connection_started = None
         self.pack = None
         self.version = None
@@ -107,21 +120,17 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
     def complete(self):
         """ Complete the use of this spa class """
         super().close()
-        self._ping_thread.join()
 
     @property
     def accessors(self):
         return self.struct.accessors
 
     def _on_partial_status_update(self, handler, socket, sender):
-        for change in handler.changes:
-            self.struct.replace_status_block_segment(change[0], change[1])
-        else:
-            handler.changes.clear()
+        self.struct.replace_status_block_segments(handler.changes)
+        handler.changes.clear()
 
     def _on_set_value(self, pos, length, newvalue):
         # We issue a pack command to acheive this ...
-        self.add_receive_handler(GeckoPackCommandProtocolHandler())
         self.queue_send(
             GeckoPackCommandProtocolHandler.set_value(
                 self.get_and_increment_sequence_counter(),
@@ -138,13 +147,17 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
 
     def _on_config_received(self, handler, socket, sender):
         # XML is case-sensitive, but the platform from the config isn't formed the same,
-        # so we manually search the Plateform nodes to find the one we're interested in
-        for plateform in self.xml.findall(GeckoConstants.SPA_PACK_PLATEFORM_XPATH):
-            if (
-                plateform.attrib[GeckoConstants.SPA_PACK_NAME_ATTRIB].lower()
-                == handler.plateform_key.lower()
-            ):
-                self.gecko_pack_xml = plateform
+        # so we index the Plateform nodes by lowercase name to find the one we want
+        if self._plateforms_by_name is None:
+            self._plateforms_by_name = {
+                plateform.attrib[GeckoConstants.SPA_PACK_NAME_ATTRIB].lower(): plateform
+                for plateform in self.xml.iterfind(
+                    GeckoConstants.SPA_PACK_PLATEFORM_XPATH
+                )
+            }
+        self.gecko_pack_xml = self._plateforms_by_name.get(
+            handler.plateform_key.lower()
+        )
 
         # We can't carry on without information on how the STATV data block is formed
         if self.gecko_pack_xml is None:
@@ -156,22 +169,25 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
 
         # Stash the config and log structure declarations
         self.config_version = handler.config_version
-        self.config_xml = self.gecko_pack_xml.find(
-            GeckoConstants.SPA_PACK_CONFIG_XPATH.format(self.config_version)
-        )
+        self.config_xml = self.gecko_pack_xml.find(GeckoConstants.SPA_PACK_CONFIG_XPATH)
         if self.config_xml is None:
             raise Exception(
                 f"Cannot find XML configuraton for {handler.plateform_key}"
                 f" v{self.config_version}"
             )
         self.log_version = handler.log_version
-        self.log_xml = self.gecko_pack_xml.find(
-            GeckoConstants.SPA_PACK_LOG_XPATH.format(self.log_version)
-        )
+        self.log_xml = self.gecko_pack_xml.find(GeckoConstants.SPA_PACK_LOG_XPATH)
         if self.log_xml is None:
             raise Exception(
                 f"Cannot find XML log for {handler.plateform_key} v{self.log_version}"
             )
+        # The live block range is requested on every refresh, so parse it now
+        self._log_begin = int(
+            self.log_xml.attrib[GeckoConstants.SPA_PACK_STRUCT_BEGIN_ATTRIB]
+        )
+        self._log_end = int(
+            self.log_xml.attrib[GeckoConstants.SPA_PACK_STRUCT_END_ATTRIB]
+        )
         self.pack_type = int(
             self.gecko_pack_xml.attrib[GeckoConstants.SPA_PACK_STRUCT_TYPE_ATTRIB]
         )
@@ -228,12 +244,7 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
 
     @property
     def sendparms(self):
-        return (
-            self.descriptor.destination[0],
-            self.descriptor.destination[1],
-            self.descriptor.identifier,
-            self.descriptor.client_identifier,
-        )
+        return self._sendparms
 
     def _on_ping_response(self, handler, socket, sender):
         self._last_ping = time.monotonic()
@@ -245,13 +256,14 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
         self.open()
         self.queue_send(
             GeckoHelloProtocolHandler.client(self.descriptor.client_identifier),
-            self.descriptor.destination,
+            self._destination,
         )
         self._ping_handler = GeckoPingProtocolHandler.request(
             parms=self.sendparms, on_handled=self._on_ping_response
         )
         self.add_receive_handler(self._ping_handler)
-        self._ping_thread.start()
+        # Pings are sent from the socket thread, starting straight away
+        self._next_ping = time.monotonic()
         # Get the intouch version
         logger.info("Starting spa connection handshake...")
         version_handler = GeckoVersionProtocolHandler.request(
@@ -264,11 +276,9 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
         return self
 
     def _loop_func(self):
-        if self._is_connected:
-            return
-        if self.isopen:
-            if self.struct.had_at_least_one_block:
-                self._final_connect()
+        if not self._is_connected and self.struct.had_at_least_one_block:
+            self._final_connect()
+        self._ping_if_due()
 
     def _final_connect(self):
         logger.debug("Connected, build accessors")
@@ -276,33 +286,52 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
             raise AttributeError("Config or Log XML is None")
         self.struct.build_accessors([self.config_xml, self.log_xml])
         self.pack = self.accessors[GeckoConstants.KEY_PACK_TYPE].value
-        self.version = "{0} v{1}.{2}".format(
-            self.accessors[GeckoConstants.KEY_PACK_CONFIG_ID].value,
-            self.accessors[GeckoConstants.KEY_PACK_CONFIG_REV].value,
-            self.accessors[GeckoConstants.KEY_PACK_CONFIG_REL].value,
-        )
+        # Format the version once, then again only if any part of it changes
+        self._update_version()
+        for key in (
+            GeckoConstants.KEY_PACK_CONFIG_ID,
+            GeckoConstants.KEY_PACK_CONFIG_REV,
+            GeckoConstants.KEY_PACK_CONFIG_REL,
+        ):
+            self.accessors[key].watch(self._update_version)
         self.config_number = self.accessors[GeckoConstants.KEY_CONFIG_NUMBER].value
         self._is_connected = True
         if self.on_connected is not None:
             self.on_connected(self)
+        self._connected_event.set()
         logger.info("Spa is now connected")
 
-    def _ping_thread_func(self):
-        """ Ping thread function """
-        logger.info("Ping thread started, %r", self.isopen)
-        while self.isopen:
-            self.queue_send(self._ping_handler, self.sendparms)
+    def _update_version(self, *args):
+        self.version = "{0} v{1}.{2}".format(
+            self.accessors[GeckoConstants.KEY_PACK_CONFIG_ID].value,
+            self.accessors[GeckoConstants.KEY_PACK_CONFIG_REV].value,
+            self.accessors[GeckoConstants.KEY_PACK_CONFIG_REL].value,
+        )
+
+    def _ping_if_due(self):
+        """Ping the spa and refresh the live data block if the next ping is due.
+        This runs on the socket thread so there is no separate ping thread to
+        hand off to"""
+        if self._next_ping is None:
+            return
+        now = time.monotonic()
+        if now < self._next_ping:
+            return
+        if now - self._last_ping > GeckoConstants.PING_DEVICE_NOT_RESPONDING_TIMEOUT:
+            logger.warning(
+                # TODO
+                "TODO: Spa is not responding to pings, need to reconnect..."
+            )
+        self.queue_send(self._ping_handler, self.sendparms)
+        # Only refresh once connected; refresh() checks is_connected, which raises
+        # on connection timeout and that mustn't escape onto the socket thread
+        if self._is_connected:
             self.refresh()
-            self.wait(GeckoConstants.PING_FREQUENCY_IN_SECONDS)
-            if (
-                time.monotonic() - self._last_ping
-                > GeckoConstants.PING_DEVICE_NOT_RESPONDING_TIMEOUT
-            ):
-                logger.warning(
-                    # TODO
-                    "TODO: Spa is not responding to pings, need to reconnect..."
-                )
-        logger.info("Ping thread finished")
+        # Pings are scheduled against a fixed deadline so that the cadence doesn't
+        # drift, unless we've fallen so far behind that we'd have to catch up
+        self._next_ping += GeckoConstants.PING_FREQUENCY_IN_SECONDS
+        if self._next_ping < now:
+            self._next_ping = now + GeckoConstants.PING_FREQUENCY_IN_SECONDS
 
     def get_buttons(self):
         """ Get a list of buttons that can be pressed """
@@ -319,6 +348,11 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
             raise RuntimeError("Spa took too long to connect ...")
         return False
 
+    def wait_for_connection(self, timeout):
+        """Wait for the connection to complete, returning True if the spa is
+        connected or False if the timeout expired first"""
+        return self._connected_event.wait(timeout)
+
     def refresh(self):
         """ Refresh the live spa data block """
         if not self.is_connected:
@@ -328,8 +362,8 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
             self,
             GeckoStatusBlockProtocolHandler.request(
                 self.get_and_increment_sequence_counter(),
-                int(self.log_xml.attrib[GeckoConstants.SPA_PACK_STRUCT_BEGIN_ATTRIB]),
-                int(self.log_xml.attrib[GeckoConstants.SPA_PACK_STRUCT_END_ATTRIB]),
+                self._log_begin,
+                self._log_end,
                 parms=self.sendparms,
             ),
             self.sendparms,
@@ -337,7 +371,6 @@ class GeckoSpa(GeckoUdpSocket, GeckoSpaPack):
 
     def press(self, keypad):
         """ Simulate a button press """
-        self.add_receive_handler(GeckoPackCommandProtocolHandler())
         self.queue_send(
             GeckoPackCommandProtocolHandler.keypress(
                 self.get_and_increment_sequence_counter(),